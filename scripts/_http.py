@@ -0,0 +1,44 @@
+# Directory: scripts/_http.py
+#
+# Shared HTTP plumbing for every script that talks to an API: pooled
+# keep-alive connections, retries with backoff, and the ESPN disk cache.
+
+import os
+from datetime import timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession
+
+# Anchored to the scripts directory because the client invokes scripts with a
+# different working directory.
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'espn_cache')
+
+
+def build_retry_adapter(pool_size=16):
+    retry = Retry(
+        total=5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+    )
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+
+def build_session(pool_size=16):
+    """Pooled session with retries, no response caching."""
+    session = requests.Session()
+    adapter = build_retry_adapter(pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def build_cached_session(pool_size=16, expire_after=timedelta(hours=12)):
+    """Pooled session with retries whose responses persist in the shared ESPN cache."""
+    session = CachedSession(CACHE_PATH, backend='sqlite', expire_after=expire_after)
+    adapter = build_retry_adapter(pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
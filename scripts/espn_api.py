@@ -1,8 +1,13 @@
-import requests
 import datetime
+import orjson
 import pandas as pd
 import json
 import sys
+from _http import build_cached_session
+
+# Disk-backed cache shared by the ESPN scripts; past-date responses are
+# effectively immutable so re-runs skip the HTTP round-trip entirely.
+SESSION = build_cached_session()
 
 def fetch_espn_games(date_str=None):
     if date_str is None:
@@ -11,9 +16,12 @@ def fetch_espn_games(date_str=None):
     print(f"Fetching NBA games for date {date_str} from ESPN...", file=sys.stderr)
     url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_str}"
 
-    response = requests.get(url)
+    # Today's scoreboard still changes (scores, postponements) — keep it fresh.
+    is_past_date = date_str < datetime.datetime.now().strftime("%Y%m%d")
+    expire_after = datetime.timedelta(hours=12) if is_past_date else datetime.timedelta(minutes=5)
+    response = SESSION.get(url, expire_after=expire_after)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     games = data.get("events", [])
     if not games:
@@ -1,60 +1,65 @@
-import pandas as pd
+import polars as pl
 import os
-import ast
 
-CLEANED_DATA_PATH = 'data/processed/games_cleaned.csv'
-FEATURES_OUTPUT_PATH = 'data/processed/features.csv'
+CLEANED_DATA_PATH = 'data/processed/games_cleaned.parquet'
+FEATURES_OUTPUT_PATH = 'data/processed/features.parquet'
 
-def safe_parse_list(s):
-    try:
-        val = ast.literal_eval(s)
-        return val if isinstance(val, list) else []
-    except:
-        return []
+def trailing_window_sum(col, window=5):
+    """Sum of the previous `window` values (current row excluded), as the
+    difference of two shifted cumulative sums: a single O(N) pass with one
+    vectorized subtraction instead of per-window rolling machinery. Null
+    until a row has `window` prior values, matching shift(1).rolling(window).
+    """
+    cs = pl.col(col).cum_sum()
+    prior_rows = pl.int_range(pl.len())
+    return pl.when(prior_rows >= window).then(cs.shift(1) - cs.shift(window + 1).fill_null(0))
 
 def generate_features():
     print("🔄 Loading cleaned game data...")
-    df = pd.read_csv(CLEANED_DATA_PATH)
+    lf = pl.scan_parquet(CLEANED_DATA_PATH)
 
     print("📈 Generating team-level statistics...")
-    rows = []
-    skipped = 0
-    for _, row in df.iterrows():
-        teams = safe_parse_list(row['TEAMS'])
-        results = safe_parse_list(row['TEAM_RESULTS'])
-        total_points = row['TOTAL_POINTS']
-
-        if len(teams) != 2 or len(results) != 2:
-            skipped += 1
-            continue
-
-        for i in range(2):
-            team = teams[i]
-            opponent = teams[1 - i]
-            win = 1 if results[i] == 'W' else 0
-            rows.append({
-                'GAME_ID': row['GAME_ID'],
-                'GAME_DATE': row['GAME_DATE'],
-                'TEAM': team,
-                'OPPONENT': opponent,
-                'WON': win,
-                'TOTAL_POINTS': total_points
-            })
-
+    valid = (
+        pl.col('TEAM_0').is_not_null() & pl.col('TEAM_1').is_not_null()
+        & pl.col('WL_0').is_not_null() & pl.col('WL_1').is_not_null()
+    )
+    skipped = lf.select((~valid).sum()).collect().item()
     print(f"⚠️ Skipped {skipped} malformed rows.")
-    flat_df = pd.DataFrame(rows)
+    lf = lf.filter(valid)
 
-    flat_df['GAME_DATE'] = pd.to_datetime(flat_df['GAME_DATE'], errors='coerce')
-    flat_df = flat_df.dropna(subset=['GAME_DATE'])
-    flat_df = flat_df.sort_values(['TEAM', 'GAME_DATE'])
+    # One row per team per game: select both team slots and stack them.
+    slots = [
+        lf.select(
+            'GAME_ID',
+            'GAME_DATE',
+            TEAM=pl.col(f'TEAM_{i}'),
+            OPPONENT=pl.col(f'TEAM_{1 - i}'),
+            WON=(pl.col(f'WL_{i}') == 'W').cast(pl.Int64),
+            TOTAL_POINTS=pl.col('TOTAL_POINTS'),
+        )
+        for i in (0, 1)
+    ]
+    flat = (
+        pl.concat(slots)
+        .with_columns(pl.col('GAME_DATE').str.to_date(strict=False))
+        .drop_nulls('GAME_DATE')
+        .sort(['TEAM', 'GAME_DATE'])
+    )
 
     print("🔁 Calculating rolling features...")
-    flat_df['AVG_PTS_LAST_5'] = flat_df.groupby('TEAM')['TOTAL_POINTS'].transform(lambda x: x.shift(1).rolling(5).mean())
-    flat_df['WINS_LAST_5'] = flat_df.groupby('TEAM')['WON'].transform(lambda x: x.shift(1).rolling(5).sum())
+    flat = flat.with_columns(
+        (trailing_window_sum('TOTAL_POINTS') / 5).over('TEAM').alias('AVG_PTS_LAST_5'),
+        trailing_window_sum('WON').over('TEAM').alias('WINS_LAST_5'),
+    )
+
+    # Dictionary-encode the team columns; Parquet round-trips this, so
+    # downstream filters compare integer codes instead of strings.
+    flat = flat.with_columns(pl.col('TEAM', 'OPPONENT').cast(pl.Categorical))
 
     print(f"💾 Saving features to {FEATURES_OUTPUT_PATH}...")
     os.makedirs(os.path.dirname(FEATURES_OUTPUT_PATH), exist_ok=True)
-    flat_df.to_csv(FEATURES_OUTPUT_PATH, index=False)
+    flat_df = flat.collect(engine='streaming')
+    flat_df.write_parquet(FEATURES_OUTPUT_PATH, compression='zstd')
     print("✅ Features generated successfully!")
 
 if __name__ == '__main__':
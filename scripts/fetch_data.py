@@ -2,17 +2,56 @@
 
 import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from _http import build_session
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.endpoints import leaguegamefinder
 from nba_api.stats.static import teams
 from nba_api.stats.endpoints import boxscoretraditionalv2
 
+MAX_WORKERS = 4
+REQUEST_INTERVAL = 1.2 / MAX_WORKERS  # keep the old overall request rate
+
+
+class RateLimiter:
+    """Spaces out request starts so pooled workers stay under stats.nba.com limits."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        time.sleep(max(0.0, start - now))
+
+
+_rate_limiter = RateLimiter(REQUEST_INTERVAL)
+
+
+# The static team list never changes within a run; resolve it once and keep a
+# lowercase name -> id lookup so repeated get_team_id calls are dict hits.
+_TEAMS = teams.get_teams()
+_TEAM_ID_BY_NAME = {team['full_name'].lower(): team['id'] for team in _TEAMS}
+
 
 def get_team_id(team_name):
-    nba_teams = teams.get_teams()
-    for team in nba_teams:
-        if team_name.lower() in team['full_name'].lower():
-            return team['id']
+    name = team_name.lower()
+    team_id = _TEAM_ID_BY_NAME.get(name)
+    if team_id is not None:
+        return team_id
+    # Fall back to the old substring match for partial names
+    for full_name, candidate in _TEAM_ID_BY_NAME.items():
+        if name in full_name:
+            return candidate
     return None
 
 
@@ -24,20 +63,29 @@ def fetch_games_by_team(team_id, season='2023-24'):
 
 def save_games_to_csv(games_df, team_name):
     filename = f"data/raw/{team_name.replace(' ', '_').lower()}_games.csv"
-    games_df.to_csv(filename, index=False)
+    # pyarrow's C++ CSV writer formats and flushes in blocks instead of pandas'
+    # per-cell Python formatter
+    pacsv.write_csv(pa.Table.from_pandas(games_df, preserve_index=False), filename)
     print(f"Saved to {filename}")
 
 
+def _fetch_and_save_team(team):
+    _rate_limiter.wait()
+    print(f"Fetching: {team['full_name']}")
+    games = fetch_games_by_team(team['id'])
+    save_games_to_csv(games, team['full_name'])
+
+
 def fetch_and_save_all_teams():
-    nba_teams = teams.get_teams()
-    for team in nba_teams:
-        print(f"Fetching: {team['full_name']}")
-        try:
-            games = fetch_games_by_team(team['id'])
-            save_games_to_csv(games, team['full_name'])
-            time.sleep(1.2)  # avoid rate limiting
-        except Exception as e:
-            print(f"Error fetching {team['full_name']}: {e}")
+    NBAStatsHTTP.set_session(build_session(pool_size=8))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(_fetch_and_save_team, team): team for team in _TEAMS}
+        for future in as_completed(futures):
+            team = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error fetching {team['full_name']}: {e}")
 
 
 if __name__ == '__main__':
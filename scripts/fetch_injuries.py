@@ -1,10 +1,14 @@
 import os
 import json
-import requests
+import orjson
 import pandas as pd
+import polars as pl
 from datetime import datetime
+from _http import build_cached_session
 
-INJURIES_CSV_PATH = 'data/raw/injuries.csv'
+INJURIES_CSV_PATH = 'data/raw/injuries.csv'  # legacy store, migrated on first run
+INJURIES_PARQUET_PATH = 'data/raw/injuries.parquet'
+SESSION = build_cached_session()
 
 def fetch_injury_report() -> pd.DataFrame:
     """
@@ -39,12 +43,12 @@ def fetch_injury_report() -> pd.DataFrame:
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
     }
-    resp = requests.get(url, headers=headers)
+    resp = SESSION.get(url, headers=headers)
     if resp.status_code != 200:
         print(f"⚠️ Error {resp.status_code} while fetching injury data.")
         return pd.DataFrame()
 
-    data = resp.json()
+    data = orjson.loads(resp.content)
     print("DEBUG: Top-level keys:", list(data.keys()))
     # Should see something like ['timestamp', 'status', 'season', 'injuries']
 
@@ -115,36 +119,43 @@ def fetch_injury_report() -> pd.DataFrame:
     df_injuries = pd.DataFrame(all_injuries)
     return df_injuries
 
-def save_injuries_to_csv(injuries_df: pd.DataFrame, csv_path: str = INJURIES_CSV_PATH):
+def save_injuries_to_parquet(injuries_df: pd.DataFrame, path: str = INJURIES_PARQUET_PATH):
     """
-    Saves the fetched injuries to a CSV, appending if the file already exists.
+    Saves the fetched injuries to a Parquet file, appending if it already exists.
     Duplicates are dropped based on (TEAM, PLAYER, INJURY_STATUS, START_DATE).
+    A pre-existing injuries.csv is folded in once and the Parquet store takes over.
     """
     if injuries_df.empty:
         print("⚠️ No injury data to save (DataFrame is empty).")
         return
 
     # Ensure directory exists
-    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-
-    if os.path.exists(csv_path):
-        existing = pd.read_csv(csv_path)
-        combined = pd.concat([existing, injuries_df], ignore_index=True)
-        combined.drop_duplicates(
-            subset=["TEAM", "PLAYER", "INJURY_STATUS", "START_DATE"],
-            keep='last',
-            inplace=True
-        )
-        combined.to_csv(csv_path, index=False)
-        print(f"✅ Appended new injury records to {csv_path}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    new = pl.from_pandas(injuries_df)
+
+    if os.path.exists(path):
+        existing = pl.read_parquet(path)
+    elif os.path.exists(INJURIES_CSV_PATH):
+        print(f"ℹ️ Migrating legacy {INJURIES_CSV_PATH} into {path}...")
+        existing = pl.read_csv(INJURIES_CSV_PATH, infer_schema=False)
     else:
-        injuries_df.to_csv(csv_path, index=False)
-        print(f"✅ Created new injury CSV at {csv_path}")
+        new.write_parquet(path, compression='zstd')
+        print(f"✅ Created new injury Parquet store at {path}")
+        return
+
+    combined = pl.concat([existing, new], how='vertical_relaxed').unique(
+        subset=["TEAM", "PLAYER", "INJURY_STATUS", "START_DATE"],
+        keep='last',
+        maintain_order=True,
+    )
+    combined.write_parquet(path, compression='zstd')
+    print(f"✅ Appended new injury records to {path}")
 
 if __name__ == "__main__":
     df_injuries = fetch_injury_report()
     if not df_injuries.empty:
-        save_injuries_to_csv(df_injuries, INJURIES_CSV_PATH)
+        save_injuries_to_parquet(df_injuries, INJURIES_PARQUET_PATH)
         print("✅ Injury data fetched and saved successfully.")
     else:
-        print("⚠️ No injury data was fetched. CSV will not be updated.")
\ No newline at end of file
+        print("⚠️ No injury data was fetched. Parquet store will not be updated.")
\ No newline at end of file
@@ -4,7 +4,7 @@ from datetime import datetime
 from espn_api import fetch_espn_games
 from sklearn.ensemble import RandomForestClassifier
 
-FEATURES_PATH = 'data/processed/features.csv'
+FEATURES_PATH = 'data/processed/features.parquet'
 MODEL_PATH = 'models/over_under_model.pkl'
 
 # 🔁 ESPN full team name -> abbreviation used in features.csv
@@ -23,11 +23,24 @@ TEAM_NAME_MAP = {
 
 def predict_today_games():
     print("🔮 Loading model and features...")
-    with open(MODEL_PATH, 'rb') as f:
-        model: RandomForestClassifier = joblib.load(MODEL_PATH)
-
-    features_df = pd.read_csv(FEATURES_PATH)
-    features_df['GAME_DATE'] = pd.to_datetime(features_df['GAME_DATE'])
+    # mmap the forest's arrays from disk instead of materializing them on the heap
+    model: RandomForestClassifier = joblib.load(MODEL_PATH, mmap_mode='r')
+
+    # Columnar read of just the columns the predictions use
+    features_df = pd.read_parquet(
+        FEATURES_PATH,
+        columns=['TEAM', 'GAME_DATE', 'AVG_PTS_LAST_5', 'WINS_LAST_5'],
+    )
+
+    # Most recent complete row per team, computed once up front instead of
+    # re-filtering and re-sorting the whole frame for every matchup.
+    latest_stats = (
+        features_df.dropna(subset=['AVG_PTS_LAST_5', 'WINS_LAST_5'])
+        .sort_values('GAME_DATE')
+        .groupby('TEAM')
+        .tail(1)
+        .set_index('TEAM')
+    )
 
     print("🗓️ Getting today’s games from ESPN...")
     espn_games = pd.DataFrame(fetch_espn_games())
@@ -37,54 +50,44 @@ def predict_today_games():
         return
 
     today = pd.to_datetime(datetime.today().date())
-    predictions = []
-
-    for _, row in espn_games.iterrows():
-        # Normalize full names to abbreviations
-        team1 = TEAM_NAME_MAP.get(row['home_team'])
-        team2 = TEAM_NAME_MAP.get(row['away_team'])
+    matchups = []
+    feature_columns = {'AVG_PTS_LAST_5': [], 'WINS_LAST_5': []}
 
-        if not team1 or not team2:
-            print(f"❌ Unknown team name in matchup: {row['away_team']} @ {row['home_team']}")
-            continue
+    # Normalize full names to abbreviations in one vectorized pass
+    espn_games['home_abbr'] = espn_games['home_team'].map(TEAM_NAME_MAP)
+    espn_games['away_abbr'] = espn_games['away_team'].map(TEAM_NAME_MAP)
+    unknown = espn_games['home_abbr'].isna() | espn_games['away_abbr'].isna()
+    for _, row in espn_games[unknown].iterrows():
+        print(f"❌ Unknown team name in matchup: {row['away_team']} @ {row['home_team']}")
+    espn_games = espn_games[~unknown]
 
-        # Get most recent data for both teams
-        team1_stats = features_df[features_df['TEAM'] == team1].sort_values('GAME_DATE').dropna().iloc[-1:]
-        team2_stats = features_df[features_df['TEAM'] == team2].sort_values('GAME_DATE').dropna().iloc[-1:]
+    for _, row in espn_games.iterrows():
+        team1 = row['home_abbr']
+        team2 = row['away_abbr']
 
-        if team1_stats.empty or team2_stats.empty:
+        # Get most recent data for both teams — O(1) index lookups
+        if team1 not in latest_stats.index or team2 not in latest_stats.index:
             print(f"⚠️ Skipping {row['away_team']} vs {row['home_team']} — missing historical data.")
             continue
 
-        if pd.isna(team1_stats['AVG_PTS_LAST_5'].values[0]) or pd.isna(team2_stats['AVG_PTS_LAST_5'].values[0]):
-            print(f"⚠️ Incomplete data for {team1} vs {team2} — using best available.")
-
-        avg_pts = (
-            team1_stats['AVG_PTS_LAST_5'].values[0] +
-            team2_stats['AVG_PTS_LAST_5'].values[0]
-        ) / 2
-
-        wins = (
-            team1_stats['WINS_LAST_5'].values[0] +
-            team2_stats['WINS_LAST_5'].values[0]
-        ) / 2
-
-        feature_row = pd.DataFrame([{
-            'AVG_PTS_LAST_5': avg_pts,
-            'WINS_LAST_5': wins
-        }])
+        team1_stats = latest_stats.loc[team1]
+        team2_stats = latest_stats.loc[team2]
 
-        prediction = model.predict(feature_row)[0]
-        label = 'OVER' if prediction == 1 else 'UNDER'
+        avg_pts = (team1_stats['AVG_PTS_LAST_5'] + team2_stats['AVG_PTS_LAST_5']) / 2
+        wins = (team1_stats['WINS_LAST_5'] + team2_stats['WINS_LAST_5']) / 2
 
-        predictions.append({
-            'matchup': f"{row['away_team']} @ {row['home_team']}",
-            'prediction': label
-        })
+        matchups.append(f"{row['away_team']} @ {row['home_team']}")
+        feature_columns['AVG_PTS_LAST_5'].append(avg_pts)
+        feature_columns['WINS_LAST_5'].append(wins)
 
     print("\n📊 Predictions for Today:")
-    for pred in predictions:
-        print(f"➡️ {pred['matchup']}: {pred['prediction']}")
+    if matchups:
+        # One predict call for the whole slate amortizes sklearn's
+        # per-call validation and dispatch overhead.
+        preds = model.predict(pd.DataFrame(feature_columns))
+        for matchup, pred in zip(matchups, preds):
+            label = 'OVER' if pred == 1 else 'UNDER'
+            print(f"➡️ {matchup}: {label}")
 
 if __name__ == '__main__':
     predict_today_games()
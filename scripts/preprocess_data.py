@@ -1,38 +1,56 @@
 import pandas as pd
 import os
 
-RAW_DATA_PATH = 'data/raw/raw_games.csv'
-OUTPUT_PATH = 'data/processed/games_cleaned.csv'
+RAW_DATA_PATH = 'data/raw/raw_games.parquet'
+LEGACY_RAW_CSV_PATH = 'data/raw/raw_games.csv'
+OUTPUT_PATH = 'data/processed/games_cleaned.parquet'
 
 def preprocess_data():
     print("🔄 Loading raw data...")
-    df = pd.read_csv(RAW_DATA_PATH)
+    if os.path.exists(RAW_DATA_PATH):
+        df = pd.read_parquet(RAW_DATA_PATH)
+    else:
+        df = pd.read_csv(LEGACY_RAW_CSV_PATH)
 
     print("⚠️ Skipping SEASON_TYPE filter (column not found in data)...")
 
     # Select key columns
     df = df[['GAME_ID', 'GAME_DATE', 'TEAM_ID', 'TEAM_ABBREVIATION', 'PTS', 'MATCHUP', 'WL']]
 
-    # Create unique identifier for each game by using the lowest team ID
-    df['GAME_KEY'] = df.groupby('GAME_ID')['TEAM_ID'].transform('min')
+    # The Parquet raw store keeps ESPN's display strings; make PTS numeric
+    df['PTS'] = pd.to_numeric(df['PTS'], errors='coerce')
+
+    # Categoricals: the groupby/pivot below hashes small integer codes instead
+    # of Python strings, and Parquet keeps the dictionary encoding on disk.
+    df['TEAM_ABBREVIATION'] = df['TEAM_ABBREVIATION'].astype('category')
+    df['WL'] = df['WL'].astype('category')
 
     print("📊 Grouping data to compute total points per game...")
-    game_totals = df.groupby('GAME_ID').agg({
-        'GAME_DATE': 'first',
-        'PTS': 'sum',
-        'TEAM_ABBREVIATION': list,
-        'WL': list
-    }).reset_index()
-
-    game_totals.rename(columns={
-        'PTS': 'TOTAL_POINTS',
-        'TEAM_ABBREVIATION': 'TEAMS',
-        'WL': 'TEAM_RESULTS'
-    }, inplace=True)
+    # Two rows per game become one row per game with one column per team slot
+    # (TEAM_0/TEAM_1, WL_0/WL_1) — plain scalar columns instead of list cells,
+    # so downstream readers never re-parse them. Games without exactly two
+    # team rows are dropped here.
+    df['TEAM_SLOT'] = df.groupby('GAME_ID').cumcount()
+    df = df[df.groupby('GAME_ID')['TEAM_ID'].transform('size') == 2]
+
+    slots = df.pivot(index='GAME_ID', columns='TEAM_SLOT', values=['TEAM_ABBREVIATION', 'WL'])
+    slots.columns = [f"{'TEAM' if name == 'TEAM_ABBREVIATION' else name}_{slot}" for name, slot in slots.columns]
+
+    game_totals = (
+        df.groupby('GAME_ID')
+        .agg(GAME_DATE=('GAME_DATE', 'first'), TOTAL_POINTS=('PTS', 'sum'))
+        .join(slots)
+        .reset_index()
+    )
+
+    # pivot densifies the categoricals; re-encode the slot columns so the
+    # dictionary survives in the Parquet file
+    for col in ('TEAM_0', 'TEAM_1', 'WL_0', 'WL_1'):
+        game_totals[col] = game_totals[col].astype('category')
 
     print(f"💾 Saving cleaned data to {OUTPUT_PATH}...")
     os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    game_totals.to_csv(OUTPUT_PATH, index=False)
+    game_totals.to_parquet(OUTPUT_PATH, engine='pyarrow', compression='zstd', index=False)
     print("✅ Done!")
 
 if __name__ == '__main__':
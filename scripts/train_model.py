@@ -5,14 +5,15 @@ from sklearn.metrics import accuracy_score, classification_report
 import joblib
 import os
 
-FEATURES_PATH = 'data/processed/features.csv'
+FEATURES_PATH = 'data/processed/features.parquet'
 MODEL_OUTPUT_PATH = 'models/over_under_model.pkl'
 
 THRESHOLD = 210  # You can tune this later based on the average total points
 
 def train_model():
     print("📊 Loading feature data...")
-    df = pd.read_csv(FEATURES_PATH)
+    # Only pull the columns training actually uses
+    df = pd.read_parquet(FEATURES_PATH, columns=['AVG_PTS_LAST_5', 'WINS_LAST_5', 'TOTAL_POINTS'])
 
     print("🎯 Creating target variable (OVER_UNDER)...")
     df = df.dropna(subset=['AVG_PTS_LAST_5', 'WINS_LAST_5'])
@@ -1,97 +1,183 @@
-import requests
+from requests_cache import NEVER_EXPIRE
+from concurrent.futures import ThreadPoolExecutor
+from _http import build_cached_session
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
 import os
 
-RAW_DATA_PATH = 'data/raw/raw_games.csv'
-
-def fetch_recent_box_scores(days_back=90):
+RAW_DATA_PATH = 'data/raw/raw_games.parquet'
+LEGACY_RAW_CSV_PATH = 'data/raw/raw_games.csv'  # folded into the Parquet store once
+STAGING_PATH = 'data/raw/raw_games_new.parquet'
+RAW_COLUMNS = [
+    'SEASON_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'GAME_ID',
+    'GAME_DATE', 'MATCHUP', 'WL', 'MIN', 'PTS', 'FGM', 'FGA', 'FG_PCT',
+    'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB',
+    'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PLUS_MINUS',
+]
+# ESPN serves everything as display strings; types are coerced downstream.
+RAW_SCHEMA = pa.schema([(name, pa.string()) for name in RAW_COLUMNS])
+MAX_WORKERS = 8
+
+def build_session():
+    """Cached, pooled session so concurrent ESPN fetches reuse connections
+    and re-runs skip HTTP for responses already on disk."""
+    return build_cached_session(pool_size=16)
+
+def _get_json(session, url, **kwargs):
+    resp = session.get(url, timeout=10, **kwargs)
+    if resp.status_code != 200:
+        return None
+    return orjson.loads(resp.content)
+
+def _append_box_score(columns, game_id, game_date, box_data):
+    teams = box_data.get('boxscore', {}).get('teams', [])
+
+    if not teams or len(teams) != 2:
+        return  # Skip incomplete games
+
+    for team in teams:
+        stats = team.get('statistics')
+        if not stats:
+            continue  # Skip if no stats are available
+
+        stat_map = {s['name']: s['displayValue'] for s in stats}
+        team_info = team['team']
+
+        values = (
+            '2024-25',
+            str(team_info.get('id', '')),
+            team_info.get('abbreviation', ''),
+            team_info.get('displayName', ''),
+            str(game_id),
+            game_date,
+            f"{team_info.get('displayName', '')} vs ???",  # Placeholder
+            team.get('winner', False) and 'W' or 'L',
+            stat_map.get('MIN', '240'),
+            stat_map.get('PTS', '0'),
+            stat_map.get('FGM', '0'),
+            stat_map.get('FGA', '0'),
+            stat_map.get('FG%', '0'),
+            stat_map.get('3PM', '0'),
+            stat_map.get('3PA', '0'),
+            stat_map.get('3P%', '0'),
+            stat_map.get('FTM', '0'),
+            stat_map.get('FTA', '0'),
+            stat_map.get('FT%', '0'),
+            stat_map.get('OREB', '0'),
+            stat_map.get('DREB', '0'),
+            stat_map.get('REB', '0'),
+            stat_map.get('AST', '0'),
+            stat_map.get('STL', '0'),
+            stat_map.get('BLK', '0'),
+            stat_map.get('TO', '0'),
+            stat_map.get('PF', '0'),
+            stat_map.get('+/-', '0'),
+        )
+        for name, value in zip(RAW_COLUMNS, values):
+            columns[name].append(value)
+
+def fetch_recent_box_scores(days_back=90, staging_path=STAGING_PATH):
+    """Fetches box scores date by date and streams each day's rows straight
+    into a staging Parquet file, so peak memory stays at one day's games and
+    a crash leaves the already-written chunks durable on disk.
+
+    Returns the number of rows written to the staging file.
+    """
     today = datetime.today()
-    recent_data = []
+    session = build_session()
 
     print(f"📰 Scraping ESPN box scores for the last {days_back} days...")
 
-    for delta in range(days_back):
-        date = (today - timedelta(days=delta)).strftime('%Y%m%d')
-        url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date}"
-        resp = requests.get(url)
-        if resp.status_code != 200:
+    # Fetch all scoreboards concurrently, then the box scores one day at a
+    # time. JSON parsing of the payloads stays on the main thread.
+    dates = [(today - timedelta(days=delta)).strftime('%Y%m%d') for delta in range(days_back)]
+    scoreboard_urls = [
+        f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date}"
+        for date in dates
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        scoreboards = list(pool.map(lambda url: _get_json(session, url), scoreboard_urls))
+
+    games_by_date = {}
+    for date, scoreboard in zip(dates, scoreboards):
+        if scoreboard is None:
             print(f"⚠️ Failed to get data for {date}")
             continue
+        games_by_date[date] = [
+            (game['id'], game['date'][:10], game.get('status', {}).get('type', {}).get('completed', False))
+            for game in scoreboard.get("events", [])
+        ]
+
+    def _fetch_box(entry):
+        game_id, _, completed = entry
+        url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event={game_id}"
+        # Box scores of finished games never change — cache them forever.
+        if completed:
+            return _get_json(session, url, expire_after=NEVER_EXPIRE)
+        return _get_json(session, url)
+
+    total_rows = 0
+    writer = pq.ParquetWriter(staging_path, RAW_SCHEMA, compression='zstd')
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            for date, game_index in games_by_date.items():
+                if not game_index:
+                    continue
+                box_scores = list(pool.map(_fetch_box, game_index))
+
+                # One list per output column: building columns directly skips
+                # per-row dict allocations and the dtype-inference pass.
+                columns = {name: [] for name in RAW_COLUMNS}
+                for (game_id, game_date, completed), box_data in zip(game_index, box_scores):
+                    if box_data is None:
+                        continue
+                    _append_box_score(columns, game_id, game_date, box_data)
+
+                if columns['GAME_ID']:
+                    writer.write_table(pa.Table.from_pydict(columns, schema=RAW_SCHEMA))
+                    total_rows += len(columns['GAME_ID'])
+    finally:
+        writer.close()
+
+    return total_rows
+
+def merge_new_games(staging_path=STAGING_PATH):
+    """Folds the staged rows into the raw Parquet store, deduplicating on
+    (GAME_ID, TEAM_ID). A legacy raw_games.csv is migrated in on first run."""
+    if not os.path.exists(staging_path):
+        print("⚠️ No new data to append.")
+        return
 
-        games = resp.json().get("events", [])
-        for game in games:
-            game_id = game['id']
-            game_date = game['date'][:10]
-            box_url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event={game_id}"
-            box_resp = requests.get(box_url)
-            if box_resp.status_code != 200:
-                continue
-
-            box_data = box_resp.json()
-            teams = box_data.get('boxscore', {}).get('teams', [])
-
-            if not teams or len(teams) != 2:
-                continue  # Skip incomplete games
-
-            for team in teams:
-                stats = team.get('statistics')
-                if not stats:
-                    continue  # Skip if no stats are available
-
-                stat_map = {s['name']: s['displayValue'] for s in stats}
-                team_info = team['team']
-
-                entry = {
-                    'SEASON_ID': '2024-25',
-                    'TEAM_ID': team_info.get('id', ''),
-                    'TEAM_ABBREVIATION': team_info.get('abbreviation', ''),
-                    'TEAM_NAME': team_info.get('displayName', ''),
-                    'GAME_ID': game_id,
-                    'GAME_DATE': game_date,
-                    'MATCHUP': f"{team_info.get('displayName', '')} vs ???",  # Placeholder
-                    'WL': team.get('winner', False) and 'W' or 'L',
-                    'MIN': stat_map.get('MIN', '240'),
-                    'PTS': stat_map.get('PTS', '0'),
-                    'FGM': stat_map.get('FGM', '0'),
-                    'FGA': stat_map.get('FGA', '0'),
-                    'FG_PCT': stat_map.get('FG%', '0'),
-                    'FG3M': stat_map.get('3PM', '0'),
-                    'FG3A': stat_map.get('3PA', '0'),
-                    'FG3_PCT': stat_map.get('3P%', '0'),
-                    'FTM': stat_map.get('FTM', '0'),
-                    'FTA': stat_map.get('FTA', '0'),
-                    'FT_PCT': stat_map.get('FT%', '0'),
-                    'OREB': stat_map.get('OREB', '0'),
-                    'DREB': stat_map.get('DREB', '0'),
-                    'REB': stat_map.get('REB', '0'),
-                    'AST': stat_map.get('AST', '0'),
-                    'STL': stat_map.get('STL', '0'),
-                    'BLK': stat_map.get('BLK', '0'),
-                    'TOV': stat_map.get('TO', '0'),
-                    'PF': stat_map.get('PF', '0'),
-                    'PLUS_MINUS': stat_map.get('+/-', '0')
-                }
-
-                recent_data.append(entry)
-
-    return pd.DataFrame(recent_data)
-
-def append_to_raw_csv(new_data: pd.DataFrame):
+    new_data = pd.read_parquet(staging_path)
     if new_data.empty:
         print("⚠️ No new data to append.")
+        os.remove(staging_path)
         return
 
     if os.path.exists(RAW_DATA_PATH):
-        existing = pd.read_csv(RAW_DATA_PATH)
+        existing = pd.read_parquet(RAW_DATA_PATH)
+    elif os.path.exists(LEGACY_RAW_CSV_PATH):
+        print(f"ℹ️ Migrating legacy {LEGACY_RAW_CSV_PATH} into {RAW_DATA_PATH}...")
+        existing = pd.read_csv(LEGACY_RAW_CSV_PATH, dtype=str)
+    else:
+        existing = None
+
+    if existing is not None:
         combined = pd.concat([existing, new_data], ignore_index=True)
     else:
         combined = new_data
 
     combined.drop_duplicates(subset=['GAME_ID', 'TEAM_ID'], inplace=True)
-    combined.to_csv(RAW_DATA_PATH, index=False)
+    combined.to_parquet(RAW_DATA_PATH, engine='pyarrow', compression='zstd', index=False)
+    os.remove(staging_path)
     print(f"✅ Appended {len(new_data)} new rows to {RAW_DATA_PATH}")
 
 if __name__ == '__main__':
-    new_games_df = fetch_recent_box_scores(days_back=90)
-    append_to_raw_csv(new_games_df)
+    rows_written = fetch_recent_box_scores(days_back=90)
+    if rows_written:
+        merge_new_games()
+    else:
+        print("⚠️ No new data to append.")
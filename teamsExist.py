@@ -1,4 +1,4 @@
 import pandas as pd
 
-df = pd.read_csv('data/processed/features.csv')
+df = pd.read_parquet('data/processed/features.parquet')
 print(df['TEAM'].unique())  # See which teams are included